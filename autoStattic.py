@@ -1,15 +1,48 @@
+import io
 import os
 import re
-import requests
+import asyncio
+import aiohttp
+import orjson
 import yaml
 import argparse
 import html2text
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
+from html.parser import HTMLParser
 from tqdm import tqdm
 
+try:
+    from yaml import CSafeDumper as YamlDumper  # libyaml-backed, much faster
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+
+try:
+    from markdownify import MarkdownConverter
+except ImportError:  # Only needed for --converter markdownify
+    MarkdownConverter = None
+
 # Output directory for Markdown files
 CONTENT_DIR = "content"
 
+# Only the ID and name of users and terms are used
+TERM_FIELDS = ("id", "name")
+
+# Maximum number of pages requested at the same time for a single endpoint
+MAX_CONCURRENT_REQUESTS = 10
+
+# Number of posts sent to a conversion worker process at a time
+CONVERSION_CHUNKSIZE = 16
+
+# Keep-alive connections shared by every request to the WordPress site
+CONNECTION_POOL_SIZE = 20
+
+# Retry transient gateway errors with exponential backoff
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUSES = (502, 503, 504)
+
 # Ensure content directory exists
 if not os.path.exists(CONTENT_DIR):
     os.makedirs(CONTENT_DIR)
@@ -25,90 +58,276 @@ html_converter.ignore_emphasis = False  # Keep bold/italic
 html_converter.ignore_tables = False  # Allow table HTML
 html_converter.bypass_tables = False  # Keep tables as HTML
 
-def fetch_wordpress_data(domain_url, endpoint, per_page=100):
-    """Fetch paginated data from the WordPress REST API."""
-    data = []
-    page = 1
-
-    while True:
-        url = f"{domain_url}/wp-json/wp/v2/{endpoint}?per_page={per_page}&page={page}&_embed"
-        response = requests.get(url)
-
-        # Check if the response is empty or not a valid JSON response
+# Available HTML to Markdown converters, the first one is the default
+MARKDOWN_CONVERTERS = ("html2text", "markdownify")
+
+# HTML elements that never have a closing tag
+_VOID_ELEMENTS = frozenset({'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'})
+
+# Post fields that are either not wanted in the frontmatter or already set from their processed values
+_EXCLUDED_METADATA_FIELDS = frozenset({
+    'content', 'excerpt', 'guid', '_links', '_embedded', 'acf',
+    'title', 'date', 'author', 'categories', 'tags', 'type', 'custom_url',
+})
+
+def create_session():
+    """Create the HTTP session reused for every request, so connections are kept alive."""
+    connector = aiohttp.TCPConnector(limit=CONNECTION_POOL_SIZE)
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=5, sock_read=30)
+    headers = {"Accept-Encoding": "gzip, deflate"}  # Let WordPress compress the JSON responses
+    return aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers)
+
+async def fetch_json(session, url):
+    """Fetch a URL and return its decoded JSON body along with the response headers."""
+    for attempt in range(MAX_RETRIES + 1):
+        retries_left = attempt < MAX_RETRIES
         try:
-            response.raise_for_status()
-            items = response.json()
+            async with session.get(url) as response:
+                if response.status in RETRY_STATUSES and retries_left:
+                    await asyncio.sleep(RETRY_BACKOFF_FACTOR * 2 ** attempt)
+                    continue
+                response.raise_for_status()
+                return orjson.loads(await response.read()), response.headers
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if not retries_left:
+                raise
+            await asyncio.sleep(RETRY_BACKOFF_FACTOR * 2 ** attempt)
+
+async def fetch_wordpress_data_async(session, domain_url, endpoint, per_page=100, fields=None):
+    """Fetch paginated data from the WordPress REST API, requesting all pages concurrently.
+
+    Pass `fields` to only have WordPress return those keys for each item.
+    """
+    def page_url(page):
+        url = f"{domain_url}/wp-json/wp/v2/{endpoint}?per_page={per_page}&page={page}"
+        if fields:
+            url += f"&_fields={','.join(fields)}"
+        return url
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def fetch_page(url):
+        async with semaphore:
+            return await fetch_json(session, url)
+
+    # Fetch the first page to find out how many pages there are in total
+    url = page_url(1)
+    try:
+        data, headers = await fetch_json(session, url)
+    except aiohttp.ClientResponseError as http_err:
+        tqdm.write(f"HTTP error occurred: {http_err} - {url}")
+        return []
+    except orjson.JSONDecodeError as json_err:
+        tqdm.write(f"JSON decode error: {json_err} - {url}")
+        return []
+    except Exception as err:
+        tqdm.write(f"Other error occurred: {err} - {url}")
+        return []
+
+    if not data:  # No data returned
+        tqdm.write(f"No data found at {url}")
+        return []
 
-            if not items:  # No data returned
-                tqdm.write(f"No data found at {url}")
+    try:
+        total_pages = int(headers["X-WP-TotalPages"])
+    except (KeyError, ValueError):
+        total_pages = None
+
+    if total_pages is None:
+        # Some proxies and security plugins strip the X-WP-* headers, so keep
+        # requesting pages one at a time until a short or empty page comes back
+        if len(data) < per_page:
+            return data
+        tqdm.write(f"X-WP-TotalPages header missing, fetching pages one at a time - {url}")
+        page = 2
+        while True:
+            url = page_url(page)
+            try:
+                items, _ = await fetch_json(session, url)
+            except aiohttp.ClientResponseError as http_err:
+                tqdm.write(f"HTTP error occurred: {http_err} - {url}")
+                break
+            except orjson.JSONDecodeError as json_err:
+                tqdm.write(f"JSON decode error: {json_err} - {url}")
+                break
+            except Exception as err:
+                tqdm.write(f"Other error occurred: {err} - {url}")
                 break
 
+            if not items:
+                break
             data.extend(items)
-            
+
             # If fewer items than `per_page` are returned, we reached the end
             if len(items) < per_page:
                 break
+            page += 1
+
+        return data
 
-        except requests.exceptions.HTTPError as http_err:
-            tqdm.write(f"HTTP error occurred: {http_err} - {url}")
-            break
-        except requests.exceptions.JSONDecodeError as json_err:
-            tqdm.write(f"JSON decode error: {json_err} - {url}")
-            break
-        except Exception as err:
-            tqdm.write(f"Other error occurred: {err} - {url}")
-            break
+    # Dispatch the remaining pages concurrently, bounded to respect server limits
+    urls = [page_url(page) for page in range(2, total_pages + 1)]
+    results = await asyncio.gather(*(fetch_page(url) for url in urls), return_exceptions=True)
 
-        page += 1
+    for url, result in zip(urls, results):
+        if isinstance(result, aiohttp.ClientResponseError):
+            tqdm.write(f"HTTP error occurred: {result} - {url}")
+        elif isinstance(result, orjson.JSONDecodeError):
+            tqdm.write(f"JSON decode error: {result} - {url}")
+        elif isinstance(result, BaseException):
+            tqdm.write(f"Other error occurred: {result} - {url}")
+        elif result[0]:
+            data.extend(result[0])
 
     return data
 
 def map_term_ids_to_names(ids, terms):
     """Map a list of term IDs to their names."""
-    return [terms.get(term_id, {'id': term_id, 'name': f"Unknown (ID: {term_id})"})['name'] for term_id in ids]
+    return [terms.get(term_id) or f"Unknown (ID: {term_id})" for term_id in ids]
 
-def save_as_markdown(file_path, frontmatter, content):
-    """Save data as a Markdown file with YAML frontmatter."""
+def render_markdown(frontmatter, content):
+    """Render data as the UTF-8 bytes of a Markdown file with YAML frontmatter."""
     # Ensure title is properly extracted and sanitized
     title = frontmatter.get('title', 'Untitled')
     if isinstance(title, dict):
         title = title.get('rendered', 'Untitled')
     frontmatter['title'] = title
 
-    # Save frontmatter and content as a valid Markdown file
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write("---\n")
-        yaml.dump(frontmatter, f, allow_unicode=True, sort_keys=False)
-        f.write("---\n\n")
-        f.write(content)
+    # Assemble frontmatter and content in memory so the file is written in one go
+    buf = io.BytesIO()
+    buf.write(b"---\n")
+    yaml.dump(frontmatter, buf, Dumper=YamlDumper, allow_unicode=True, encoding="utf-8", sort_keys=False)
+    buf.write(b"---\n\n")
+    buf.write(content.encode("utf-8"))
+    return buf.getvalue()
+
+def _write_markdown_sync(file_path, payload):
+    """Write a rendered Markdown file; open and write happen in one call so it can run in a thread."""
+    with open(file_path, "wb") as f:
+        f.write(payload)
+
+@lru_cache(maxsize=None)
+def _media_link_pattern(media_base_url):
+    """Compile the media link pattern for a site once per process."""
+    return re.compile(rf'!\[(.*?)\]\({re.escape(media_base_url)}/wp-content/uploads/(.*?)\)')
 
 def process_media_links(content, media_base_url):
     """Replace external media links with local versions."""
-    content = re.sub(r'!\[(.*?)\]\((https://example.com/wp-content/uploads/(.*?)\))', r'!\[\1\](\3)', content)
-    return content
-
-def convert_post_to_md(post, authors, categories, tags, custom_taxonomies, post_type="post", use_markdown=True):
-    """Convert WordPress post or page to Markdown with HTML preservation for complex blocks."""
+    return _media_link_pattern(media_base_url).sub(r'![\1](\2)', content)
+
+if MarkdownConverter is not None:
+    class _ScriptlessMarkdownConverter(MarkdownConverter):
+        """markdownify converter that drops <script> and <style> together with their contents."""
+
+        def convert_script(self, el, text, *args, **kwargs):
+            return ''
+
+        def convert_style(self, el, text, *args, **kwargs):
+            return ''
+
+def html_to_markdown(html_content, converter="html2text"):
+    """Convert an HTML fragment to Markdown with the selected converter."""
+    if converter == "markdownify":
+        return _ScriptlessMarkdownConverter(heading_style="ATX", bullets="-").convert(html_content)
+    return html_converter.handle(html_content)
+
+def _is_wp_block(class_attr):
+    """Check whether an element's class attribute marks it as a Gutenberg block."""
+    return 'wp-block' in (class_attr or '')
+
+class _GutenbergBlockLocator(HTMLParser):
+    """Find the source spans of top-level Gutenberg blocks in a single pass over the HTML."""
+
+    def __init__(self, html_content):
+        super().__init__(convert_charrefs=False)
+        self.html_content = html_content
+        self.line_offsets = [0] + [match.end() for match in re.finditer('\n', html_content)]
+        self.open_tags = []
+        self.block_start = None
+        self.spans = []
+
+    def source_offset(self):
+        line, column = self.getpos()
+        return self.line_offsets[line - 1] + column
+
+    def handle_starttag(self, tag, attrs):
+        if not self.open_tags and _is_wp_block(dict(attrs).get('class')):
+            self.block_start = self.source_offset()
+        if tag not in _VOID_ELEMENTS:
+            self.open_tags.append(tag)
+        elif self.block_start is not None and not self.open_tags:
+            self.spans.append((self.block_start, self.source_offset() + len(self.get_starttag_text())))
+            self.block_start = None
+
+    def handle_endtag(self, tag):
+        if tag not in self.open_tags:
+            return  # Stray closing tag
+        while self.open_tags.pop() != tag:
+            pass  # Implicitly close unclosed children
+        if self.block_start is not None and not self.open_tags:
+            end = self.html_content.find('>', self.source_offset()) + 1
+            self.spans.append((self.block_start, end))
+            self.block_start = None
+
+    def close(self):
+        super().close()
+        if self.block_start is not None:  # Unclosed block runs to the end of the content
+            self.spans.append((self.block_start, len(self.html_content)))
+            self.block_start = None
+
+def split_gutenberg_blocks(html_content):
+    """Split HTML into Gutenberg blocks and the content between them.
+
+    Returns a list of (is_block, html) tuples in document order. Every segment
+    is a slice of the original HTML, so preserved blocks stay byte-for-byte intact.
+    """
+    locator = _GutenbergBlockLocator(html_content)
+    locator.feed(html_content)
+    locator.close()
+
+    segments = []
+    position = 0
+    for start, end in locator.spans:
+        if start > position:
+            segments.append((False, html_content[position:start]))
+        segments.append((True, html_content[start:end]))
+        position = end
+    if position < len(html_content):
+        segments.append((False, html_content[position:]))
+    return segments
+
+def convert_post_to_md(post, post_type, domain_url, authors, categories, tags, custom_taxonomy_items, use_markdown=True, converter="html2text", excluded_fields=_EXCLUDED_METADATA_FIELDS):
+    """Convert WordPress post or page to Markdown with HTML preservation for complex blocks.
+
+    `custom_taxonomy_items` is a sequence of (taxonomy, terms) pairs and `excluded_fields`
+    the post fields left out of the generic metadata; both are built once per run.
+
+    Returns the (file_path, frontmatter, content) to save. This has no side effects
+    so it can run in a worker process.
+    """
     slug = post.get('slug', f'{post_type}-{post.get("id")}')  # Use slug or fallback to id
     slug = slug.replace('/', '-')  # Ensure no slashes in filenames
     
     # Get the raw HTML content
     html_content = post.get('content', {}).get('rendered', '')
 
-    # Split content by Gutenberg blocks or custom elements
-    # Detect Gutenberg blocks (div.wp-block-* or any element containing class="wp-block-*")
-    blocks = re.split(r'(<div[^>]*wp-block[^>]*>.*?</div>)', html_content, flags=re.DOTALL)
+    # Split content by Gutenberg blocks (any top-level element with a class="wp-block-*")
+    blocks = split_gutenberg_blocks(html_content)
 
     # Process each block, converting simple elements to Markdown and leaving complex HTML intact
     converted_content = ""
-    for block in blocks:
-        # If the block is a Gutenberg block or custom HTML, keep it as raw HTML
-        if re.search(r'wp-block', block):
+    for is_block, block in blocks:
+        # Skip whitespace between blocks, there is nothing to convert
+        if not block.strip():
+            continue
+
+        # If the block is a Gutenberg block, keep it as raw HTML
+        if is_block:
             converted_content += block.strip() + "\n\n"  # Add raw HTML block
         else:
-            # Convert simple HTML to Markdown using html2text for non-Gutenberg content
+            # Convert simple HTML to Markdown for non-Gutenberg content
             if use_markdown:
-                converted_content += html_converter.handle(block).strip() + "\n\n"
+                converted_content += html_to_markdown(block, converter).strip() + "\n\n"
             else:
                 converted_content += block.strip() + "\n\n"
 
@@ -122,12 +341,16 @@ def convert_post_to_md(post, authors, categories, tags, custom_taxonomies, post_
     # Extract the title properly from the rendered field
     title = post.get('title', {}).get('rendered', 'Untitled')
 
+    # Only run the converter when the post actually has an excerpt
+    excerpt_html = post.get('excerpt', {}).get('rendered', '').strip()
+    excerpt = html_to_markdown(excerpt_html, converter).strip() if excerpt_html else ''
+
     # Define the most important frontmatter elements first
     frontmatter = {
         'title': title,
         'date': post.get('date', ''),
         'author': author_name,
-        'excerpt': html_converter.handle(post.get('excerpt', {}).get('rendered', '')).strip(),
+        'excerpt': excerpt,
         'custom_url': post.get('slug', ''),
         'type': post_type  # 'post' or 'page'
     }
@@ -142,89 +365,125 @@ def convert_post_to_md(post, authors, categories, tags, custom_taxonomies, post_
         frontmatter['acf'] = acf_data
 
     # Add custom taxonomies
-    for taxonomy, terms in custom_taxonomies.items():
-        if taxonomy in post:
-            frontmatter[taxonomy] = map_term_ids_to_names(post.get(taxonomy, []), terms)
+    for taxonomy, terms in custom_taxonomy_items:
+        term_ids = post.get(taxonomy)
+        if term_ids is not None:
+            frontmatter[taxonomy] = map_term_ids_to_names(term_ids, terms)
 
-    # Add any other remaining metadata, excluding unnecessary fields
-    filtered_metadata = {k: v for k, v in post.items() if k not in ['content', 'excerpt', 'guid', '_links', '_embedded', 'acf']}
-    frontmatter.update(filtered_metadata)
+    # Add any other remaining metadata, without overwriting the processed values above
+    for key, value in post.items():
+        if key not in excluded_fields:
+            frontmatter.setdefault(key, value)
 
     # Define the file path based on the post type and slug
     file_dir = os.path.join(CONTENT_DIR, f"{post_type}s")
-    os.makedirs(file_dir, exist_ok=True)
-
     file_path = os.path.join(file_dir, f"{slug}.md")
 
-    # Save the post content as a markdown file
-    save_as_markdown(file_path, frontmatter, content)
-    tqdm.write(f"Saved {post_type}: {file_path}")
+    return file_path, frontmatter, content
+
+def convert_posts(batch, **options):
+    """Convert a batch of (post, post_type) pairs into (file_path, payload) pairs ready to write."""
+    results = []
+    for post, post_type in batch:
+        file_path, frontmatter, content = convert_post_to_md(post, post_type, **options)
+        results.append((file_path, render_markdown(frontmatter, content)))
+    return results
 
-def fetch_terms_by_taxonomy(domain_url, taxonomy):
+async def fetch_terms_by_taxonomy(session, domain_url, taxonomy):
     """Fetch terms for a specific taxonomy (e.g., categories, tags, custom taxonomies)."""
-    terms = fetch_wordpress_data(domain_url, taxonomy)
-    # Ensure the term data has both 'id' and 'name' keys for each term
-    return {term['id']: {'id': term['id'], 'name': term['name']} for term in terms}
+    terms = await fetch_wordpress_data_async(session, domain_url, taxonomy, fields=TERM_FIELDS)
+    # Map each term ID directly to its name
+    return {term['id']: term['name'] for term in terms}
 
-def fetch_custom_taxonomies(domain_url):
+async def fetch_custom_taxonomies(session, domain_url):
     """Fetch all available custom taxonomies from the WordPress REST API."""
     url = f"{domain_url}/wp-json/wp/v2/taxonomies"
-    response = requests.get(url)
 
     try:
-        response.raise_for_status()
-        taxonomies = response.json()
+        taxonomies, _ = await fetch_json(session, url)
 
         # Filter custom taxonomies by checking if they are not "category" or "post_tag"
         custom_taxonomies = {key: val for key, val in taxonomies.items() if key not in ['category', 'post_tag']}
         
-        # Now fetch terms for each custom taxonomy
-        taxonomy_terms = {}
-        for taxonomy in custom_taxonomies.keys():
-            terms_url = f"{domain_url}/wp-json/wp/v2/{taxonomy}?per_page=100"
-            try:
-                taxonomy_terms[taxonomy] = fetch_terms_by_taxonomy(domain_url, taxonomy)
-            except requests.exceptions.HTTPError as http_err:
-                tqdm.write(f"HTTP error occurred: {http_err} - {terms_url}")
-                continue  # Skip this taxonomy if 404 or any other error occurs
+        # Now fetch the terms of every custom taxonomy concurrently. The REST batch
+        # endpoint (batch/v1) can't combine these into one request, as it only accepts
+        # POST, PUT, PATCH and DELETE sub-requests. Failed taxonomies come back empty.
+        taxonomy_keys = list(custom_taxonomies.keys())
+        taxonomy_terms = await asyncio.gather(
+            *(fetch_terms_by_taxonomy(session, domain_url, taxonomy) for taxonomy in taxonomy_keys)
+        )
 
-        return taxonomy_terms
+        return dict(zip(taxonomy_keys, taxonomy_terms))
 
-    except requests.exceptions.HTTPError as http_err:
+    except aiohttp.ClientResponseError as http_err:
         tqdm.write(f"HTTP error occurred while fetching taxonomies: {http_err}")
-    except requests.exceptions.JSONDecodeError as json_err:
+    except orjson.JSONDecodeError as json_err:
         tqdm.write(f"JSON decode error while fetching taxonomies: {json_err}")
     except Exception as err:
         tqdm.write(f"Other error occurred while fetching taxonomies: {err}")
 
     return {}
 
-def save_posts_and_pages(domain_url, authors, categories, tags, custom_taxonomies, use_markdown):
-    """Fetch and save all posts and pages as markdown files."""
-    print("Fetching all posts...")
-    posts = fetch_wordpress_data(domain_url, "posts")
-
-    print(f"Total posts fetched: {len(posts)}")
+async def save_posts_and_pages(session, domain_url, metadata, use_markdown, converter="html2text"):
+    """Fetch and save all posts and pages as markdown files.
 
-    print("Fetching all pages...")
-    pages = fetch_wordpress_data(domain_url, "pages")
+    `metadata` is an awaitable resolving to the authors, (categories, tags) and
+    custom taxonomies, so posts and pages can be fetched while it is still running.
+    """
+    print("Fetching all posts and pages...")
+    posts, pages = await asyncio.gather(
+        fetch_wordpress_data_async(session, domain_url, "posts"),
+        fetch_wordpress_data_async(session, domain_url, "pages"),
+    )
 
+    print(f"Total posts fetched: {len(posts)}")
     print(f"Total pages fetched: {len(pages)}")
 
+    authors, (categories, tags), custom_taxonomies = await metadata
+
+    # Create the output directories up front, since the conversion workers don't write anything
+    for post_type in ("post", "page"):
+        os.makedirs(os.path.join(CONTENT_DIR, f"{post_type}s"), exist_ok=True)
+
+    # Posts and pages are independent, so convert them across all CPU cores
+    items = [(post, "post") for post in posts] + [(page, "page") for page in pages]
+    batches = [items[i:i + CONVERSION_CHUNKSIZE] for i in range(0, len(items), CONVERSION_CHUNKSIZE)]
+    convert = partial(
+        convert_posts,
+        domain_url=domain_url,
+        authors=authors,
+        categories=categories,
+        tags=tags,
+        custom_taxonomy_items=tuple(custom_taxonomies.items()),
+        use_markdown=use_markdown,
+        converter=converter,
+        # Custom taxonomy IDs are mapped to names above, don't copy them again as raw metadata
+        excluded_fields=_EXCLUDED_METADATA_FIELDS.union(custom_taxonomies),
+    )
+    loop = asyncio.get_running_loop()
+
     # Start the progress bar for both posts and pages
-    total_items = len(posts) + len(pages)
-    with tqdm(total=total_items, desc="Converting to Markdown", unit="item") as pbar:
-        for post in posts:
-            convert_post_to_md(post, authors, categories, tags, custom_taxonomies, post_type="post", use_markdown=use_markdown)
-            pbar.update(1)
-        for page in pages:
-            convert_post_to_md(page, authors, categories, tags, custom_taxonomies, post_type="page", use_markdown=use_markdown)
-            pbar.update(1)
-
-def save_authors(domain_url):
+    total_items = len(items)
+    with tqdm(total=total_items, desc="Converting to Markdown", unit="item", mininterval=0.5) as pbar:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            async def convert_and_save(batch):
+                results = await loop.run_in_executor(executor, convert, batch)
+                saved = []
+                for (_, post_type), (file_path, payload) in zip(batch, results):
+                    # Write from a thread so other batches keep converting meanwhile
+                    await asyncio.to_thread(_write_markdown_sync, file_path, payload)
+                    saved.append(f"Saved {post_type}: {file_path}")
+
+                # Report progress once per batch rather than for every file
+                tqdm.write("\n".join(saved))
+                pbar.update(len(batch))
+
+            await asyncio.gather(*(convert_and_save(batch) for batch in batches))
+
+async def save_authors(session, domain_url):
     """Fetch and save all authors as markdown metadata."""
     print("Fetching authors...")
-    authors = fetch_wordpress_data(domain_url, "users")
+    authors = await fetch_wordpress_data_async(session, domain_url, "users", fields=TERM_FIELDS)
     print(f"Total authors fetched: {len(authors)}")
 
     # Save authors as a YAML metadata file
@@ -232,40 +491,48 @@ def save_authors(domain_url):
     authors_dict = {author['id']: author['name'] for author in authors}
 
     with open(authors_path, "w") as f:
-        yaml.dump(authors_dict, f, allow_unicode=True)
+        yaml.dump(authors_dict, f, Dumper=YamlDumper, allow_unicode=True)
     print(f"Saved authors metadata: {authors_path}")
 
     return authors_dict
 
-def save_categories_and_tags(domain_url):
+async def save_categories_and_tags(session, domain_url):
     """Fetch and save all categories and tags as markdown metadata."""
-    print("Fetching categories...")
-    categories = fetch_terms_by_taxonomy(domain_url, "categories")
-    print(f"Total categories fetched: {len(categories)}")
-
-    print("Fetching tags...")
-    try:
-        tags = fetch_terms_by_taxonomy(domain_url, "tags")
-    except requests.exceptions.JSONDecodeError:
-        tqdm.write(f"Tags API did not return valid JSON; continuing without tags.")
-        tags = {}
+    print("Fetching categories and tags...")
+    categories, tags = await asyncio.gather(
+        fetch_terms_by_taxonomy(session, domain_url, "categories"),
+        fetch_terms_by_taxonomy(session, domain_url, "tags"),
+    )
 
+    print(f"Total categories fetched: {len(categories)}")
     print(f"Total tags fetched: {len(tags)}")
 
     # Save categories as a YAML metadata file
     categories_path = os.path.join(CONTENT_DIR, "categories.yml")
     with open(categories_path, "w") as f:
-        yaml.dump(categories, f, allow_unicode=True)
+        yaml.dump(categories, f, Dumper=YamlDumper, allow_unicode=True)
     tqdm.write(f"Saved categories metadata: {categories_path}")
 
     # Save tags as a YAML metadata file
     tags_path = os.path.join(CONTENT_DIR, "tags.yml")
     with open(tags_path, "w") as f:
-        yaml.dump(tags, f, allow_unicode=True)
+        yaml.dump(tags, f, Dumper=YamlDumper, allow_unicode=True)
     tqdm.write(f"Saved tags metadata: {tags_path}")
 
     return categories, tags
 
+async def main(domain_url, use_markdown, converter):
+    """Fetch everything from the WordPress site and write it out as Markdown."""
+    async with create_session() as session:
+        # Authors, categories, tags and custom taxonomies have no interdependencies,
+        # so fetch them concurrently alongside the posts and pages
+        metadata = asyncio.gather(
+            save_authors(session, domain_url),
+            save_categories_and_tags(session, domain_url),
+            fetch_custom_taxonomies(session, domain_url),
+        )
+        await save_posts_and_pages(session, domain_url, metadata, use_markdown=use_markdown, converter=converter)
+
 if __name__ == "__main__":
     # Track start time
     start_time = datetime.now()
@@ -274,16 +541,17 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Fetch WordPress data and convert to Markdown")
     parser.add_argument('domain', type=str, help="Your WordPress site URL (e.g., https://your-site.com)")
     parser.add_argument('--markdown', action='store_true', help="Convert HTML content to Markdown")
+    parser.add_argument('--converter', choices=MARKDOWN_CONVERTERS, default=MARKDOWN_CONVERTERS[0], help="HTML to Markdown converter to use")
 
     args = parser.parse_args()
     domain_url = args.domain.rstrip("/")  # Ensure no trailing slash
     use_markdown = args.markdown  # Check if markdown flag is set
 
+    if args.converter == "markdownify" and MarkdownConverter is None:
+        parser.error("--converter markdownify requires the markdownify package (pip install markdownify)")
+
     # Fetch and save authors, custom taxonomies, posts, pages, categories, and tags
-    authors = save_authors(domain_url)
-    categories, tags = save_categories_and_tags(domain_url)
-    custom_taxonomies = fetch_custom_taxonomies(domain_url)
-    save_posts_and_pages(domain_url, authors, categories, tags, custom_taxonomies, use_markdown=use_markdown)
+    asyncio.run(main(domain_url, use_markdown, args.converter))
 
     # Calculate and display total time taken
     total_time = datetime.now() - start_time